@@ -7,15 +7,26 @@ Uses Outlook COM interface (requires Outlook installed on Windows).
 """
 
 import argparse
+import gc
+import hashlib
+import json
+import multiprocessing
 import os
+import queue
 import re
+import shutil
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, TextIO
 
 try:
+    import pythoncom
     import win32com.client
     from win32com.client import CDispatch
 except ImportError:
@@ -35,11 +46,64 @@ except ImportError:
     sys.exit(1)
 
 
+# Characters invalid in Windows filenames, mapped to '_'
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*' + ''.join(chr(i) for i in range(32))})
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+_SENDER_RE = re.compile(r'^([^<]+)\s*<[^>]+>$')
+
+_DATE_FMT = "%Y-%m-%d"
+_DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Header fields read in bulk from the folder's Outlook Table, one row per email.
+# Table string columns are cut at 255 characters, so free-text fields such as
+# Subject and CC are read from the mail item instead.
+_HEADER_COLUMNS = ("EntryID", "SenderName", "SenderEmailAddress", "ReceivedTime", "LastModificationTime")
+
+# Table filter on PR_MESSAGE_CLASS so only mail items (IPM.Note and its
+# IPM.Note.* variants such as S/MIME) are ever returned
+_MAIL_FILTER = "@SQL=\"http://schemas.microsoft.com/mapi/proptag/0x001A001F\" LIKE 'IPM.Note%'"
+
+# Converted bodies keyed by a digest of their HTML; newsletters and alerts
+# repeat the same HTML across many emails. Least recently used entries are
+# evicted first.
+_HTML_CACHE_SIZE = 4096
+_html_cache: dict[bytes, str] = {}
+_html_cache_lock = threading.Lock()
+
+# Threads per PST that convert and write emails read on the Outlook thread,
+# fed through a bounded queue so the reader cannot run far ahead of them
+_RENDER_THREADS = 4
+_RENDER_QUEUE_SIZE = 32
+
+# --bundle-by: attachment-free emails are appended to one shared file per key
+_BUNDLE_CHOICES = ("day", "month", "sender")
+_BUNDLE_SEPARATOR = "\n\n---\n\n"
+# Bundle handles kept open at once; the least recently used one is closed
+# and reopened in append mode when needed again
+_MAX_OPEN_BUNDLES = 64
+_BUNDLE_BUFFER_SIZE = 1 << 16
+_bundle_lock = threading.Lock()
+# Bundle files claimed by this process per output directory, shared by every
+# folder task it runs so a key is not split across tasks
+_bundle_paths: dict[Path, dict[str, Path]] = {}
+
+# Sidecar in the output directory mapping EntryID -> (output path, last
+# modification time) so re-runs skip emails that were already converted
+_CACHE_FILENAME = ".pst2md_cache.{}.json"
+
+# Progress updates are sent to the parent in batches of this many emails,
+# or after this many seconds, instead of one queue message per email
+_PROGRESS_BATCH = 64
+_PROGRESS_INTERVAL = 0.5
+
+# Emails read between garbage collections and Outlook message pumps
+_RELEASE_INTERVAL = 256
+
+
 def sanitize_filename(name: str, max_length: int = 100) -> str:
     """Remove/replace characters invalid in Windows filenames."""
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    sanitized = re.sub(invalid_chars, '_', name)
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = name.translate(_SANITIZE_TABLE)
+    sanitized = _UNDERSCORE_RUN_RE.sub('_', sanitized)
     sanitized = sanitized.strip('. _')
     if len(sanitized) > max_length:
         sanitized = sanitized[:max_length].rstrip('. _')
@@ -56,7 +120,7 @@ def extract_sender_name(sender: str) -> str:
     if not sender:
         return "unknown"
 
-    match = re.match(r'^([^<]+)\s*<[^>]+>$', sender.strip())
+    match = _SENDER_RE.match(sender.strip())
     if match:
         return match.group(1).strip()
 
@@ -66,18 +130,113 @@ def extract_sender_name(sender: str) -> str:
     return sender.strip()
 
 
-def generate_unique_filename(base_path: Path, filename: str, extension: str = "") -> Path:
-    """Generate a unique filename by adding suffix if file exists."""
-    full_path = base_path / f"{filename}{extension}"
-    if not full_path.exists():
-        return full_path
-
-    counter = 1
+def open_unique_file(base_path: Path, filename: str, extension: str,
+                     used: set[str]) -> tuple[Path, Optional[int]]:
+    """
+    Claim a unique name in base_path, adding a numeric suffix if it is taken.
+    used holds the names already in base_path, including ones handed out
+    whose files are not written yet; the chosen name is added to it.
+    The claim creates the entry, which is atomic even against other worker
+    processes writing to the same output directory: a file is created with
+    O_EXCL and returned with its open descriptor so it can be written
+    without reopening; with an empty extension a folder is created and the
+    descriptor is None.
+    """
+    name = f"{filename}{extension}"
+    counter = 0
     while True:
-        new_path = base_path / f"{filename}_{counter}{extension}"
-        if not new_path.exists():
-            return new_path
+        if name not in used:
+            used.add(name)
+            path = base_path / name
+            try:
+                if not extension:
+                    path.mkdir()
+                    return path, None
+                flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+                return path, os.open(path, flags)
+            except FileExistsError:
+                pass
         counter += 1
+        name = f"{filename}_{counter}{extension}"
+
+
+def generate_unique_filename(base_path: Path, filename: str, extension: str, used: set[str]) -> Path:
+    """Claim a unique name like open_unique_file, closing the created file straight away."""
+    path, fd = open_unique_file(base_path, filename, extension, used)
+    if fd is not None:
+        os.close(fd)
+    return path
+
+
+def write_markdown(path: Path, content: str, fd: Optional[int] = None) -> None:
+    """
+    Write Markdown content as UTF-8 with a single raw write.
+    Skips the TextIOWrapper that Path.write_text builds per file while
+    keeping its platform newline translation. An already open descriptor
+    for path (from open_unique_file) is written to and closed instead of
+    reopening the file.
+    """
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = memoryview(content.encode('utf-8'))
+
+    if fd is None:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def release_claim(path: Path, fd: Optional[int]) -> None:
+    """Close a file claimed by open_unique_file, if still open, and remove it."""
+    if fd is not None:
+        os.close(fd)
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def remove_stale_output(md_path: Path, output_dir: Path, used: set[str]) -> None:
+    """
+    Remove the output an earlier run wrote for an email that has changed
+    since, so converting it again does not leave the old copy behind.
+    A flat .md is deleted, and so is an attachment folder with its
+    contents; the freed name is dropped from used so it can be reclaimed.
+    """
+    if md_path.parent == output_dir:
+        target = md_path
+        target.unlink(missing_ok=True)
+    elif md_path.parent.parent == output_dir:
+        target = md_path.parent
+        shutil.rmtree(target, ignore_errors=True)
+    else:
+        return
+    used.discard(target.name)
+
+
+def load_conversion_cache(cache_path: Path) -> dict[str, tuple[str, str]]:
+    """Load the EntryID cache written by a previous run, or an empty one."""
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+        return {
+            entry_id: (md_path, modified)
+            for entry_id, (md_path, modified) in cache.items()
+            if isinstance(md_path, str) and isinstance(modified, str)
+        }
+    except Exception:
+        return {}
+
+
+def save_conversion_cache(cache_path: Path, cache: dict[str, tuple[str, str]]) -> None:
+    """Write the EntryID cache, replacing the previous file atomically."""
+    temp_path = cache_path.with_suffix(".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(temp_path, cache_path)
 
 
 def format_email_date(received_time) -> tuple[str, str]:
@@ -85,15 +244,19 @@ def format_email_date(received_time) -> tuple[str, str]:
     Format email received time for filename and display.
     Returns (filename_date, display_date).
     """
+    try:
+        if hasattr(received_time, 'strftime'):
+            return received_time.strftime(_DATE_FMT), received_time.strftime(_DATETIME_FMT)
+    except Exception:
+        return "unknown-date", "Unknown"
+
     if received_time is None:
         now = datetime.now()
-        return now.strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d %H:%M:%S")
+        return now.strftime(_DATE_FMT), now.strftime(_DATETIME_FMT)
 
     try:
-        if hasattr(received_time, 'strftime'):
-            return received_time.strftime("%Y-%m-%d"), received_time.strftime("%Y-%m-%d %H:%M:%S")
         dt = datetime.fromisoformat(str(received_time))
-        return dt.strftime("%Y-%m-%d"), dt.strftime("%Y-%m-%d %H:%M:%S")
+        return dt.strftime(_DATE_FMT), dt.strftime(_DATETIME_FMT)
     except Exception:
         return "unknown-date", "Unknown"
 
@@ -101,7 +264,18 @@ def format_email_date(received_time) -> tuple[str, str]:
 def html_to_markdown(html_body: str, plain_body: str) -> str:
     """Convert HTML body to Markdown, falling back to plain text if needed."""
     if html_body:
+        key = hashlib.blake2b(html_body.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with _html_cache_lock:
+            cached = _html_cache.pop(key, None)
+            if cached is not None:
+                # Re-insert so the least recently used body is evicted first
+                _html_cache[key] = cached
+                return cached
+
         try:
+            # Fresh instance per body: HTML2Text keeps parser state (open <style>
+            # blocks, link and list stacks) across handle() calls, so a reused
+            # converter can blank out every email after a malformed one.
             h = html2text.HTML2Text()
             h.ignore_links = False
             h.ignore_images = False
@@ -109,9 +283,15 @@ def html_to_markdown(html_body: str, plain_body: str) -> str:
             h.body_width = 0  # No wrapping
             h.skip_internal_links = True
             h.inline_links = True
-            return h.handle(html_body)
+            body_md = h.handle(html_body)
         except Exception:
-            pass
+            return plain_body or ""
+
+        with _html_cache_lock:
+            if len(_html_cache) >= _HTML_CACHE_SIZE:
+                del _html_cache[next(iter(_html_cache))]
+            _html_cache[key] = body_md
+        return body_md
     return plain_body or ""
 
 
@@ -122,10 +302,11 @@ def format_recipients(recipients) -> str:
 
     try:
         recipient_list = []
-        for i in range(1, recipients.Count + 1):
-            recip = recipients.Item(i)
-            name = recip.Name or recip.Address or "Unknown"
+        # Enumerate the collection rather than Count + Item(i), and read each
+        # property once: every access is a COM round-trip
+        for recip in recipients:
             address = recip.Address or ""
+            name = recip.Name or address or "Unknown"
             if address and address != name:
                 recipient_list.append(f"{name} <{address}>")
             else:
@@ -135,16 +316,31 @@ def format_recipients(recipients) -> str:
         return ""
 
 
-def create_email_markdown(mail_item) -> tuple[str, str, list[tuple[str, bytes]]]:
+def bundle_key(bundle_by: str, date_filename: str, sender_name: str) -> str:
+    """Return the bundle file name (without extension) an email belongs to."""
+    if bundle_by == "sender":
+        return sanitize_filename(sender_name)
+    if bundle_by == "month" and date_filename != "unknown-date":
+        return date_filename[:7]
+    return date_filename
+
+
+def read_email(mail_item, header: dict, output_dir: Path, used_names: set[str],
+               bundle_by: Optional[str], bundle_paths: dict[str, Path]) -> tuple[Path, dict]:
     """
-    Convert an Outlook mail item to Markdown content.
-    Returns (filename_base, markdown_content, attachments_list).
-    Attachments list contains tuples of (filename, data).
+    Read an Outlook mail item on the Outlook thread.
+    Header fields come from the folder's Table row (see _HEADER_COLUMNS).
+    Emails with attachments get their own folder and the attachments are
+    saved straight into it. With bundle_by set, other emails are routed to
+    a bundle file from bundle_paths (one per key, reserved on first use).
+    Returns (md_path, fields) where fields holds the plain Python values
+    render_email needs, so no COM object has to leave this thread, plus
+    md_fd: the open descriptor of a newly claimed flat .md file, or None.
     """
     try:
         subject = mail_item.Subject or "No Subject"
-        sender = mail_item.SenderName or mail_item.SenderEmailAddress or "Unknown"
-        received_time = mail_item.ReceivedTime
+        sender = header.get("SenderName") or header.get("SenderEmailAddress") or "Unknown"
+        received_time = header.get("ReceivedTime")
 
         to_recipients = format_recipients(mail_item.Recipients)
         cc_recipients = ""
@@ -169,175 +365,511 @@ def create_email_markdown(mail_item) -> tuple[str, str, list[tuple[str, bytes]]]
 
         filename_base = sanitize_filename(f"{date_filename}_{sender_name}_{subject}")
 
-        body_md = html_to_markdown(html_body, plain_body)
-
-        attachments: list[tuple[str, bytes]] = []
+        email_folder: Optional[Path] = None
         attachment_links: list[str] = []
 
         try:
-            for i in range(1, mail_item.Attachments.Count + 1):
-                att = mail_item.Attachments.Item(i)
-                att_filename = sanitize_filename(att.FileName or f"attachment_{i}")
+            attachments = mail_item.Attachments
+            att_count = attachments.Count
+            if att_count:
+                email_folder = generate_unique_filename(output_dir, filename_base, "", used_names)
 
-                temp_path = Path(os.environ.get('TEMP', '.')) / f"pst_extract_{att_filename}"
-                try:
-                    att.SaveAsFile(str(temp_path))
-                    with open(temp_path, 'rb') as f:
-                        att_data = f.read()
-                    attachments.append((att_filename, att_data))
-                    attachment_links.append(f"- [{att_filename}]({att_filename})")
-                finally:
-                    if temp_path.exists():
-                        temp_path.unlink()
+            for i in range(1, att_count + 1):
+                att = attachments.Item(i)
+                att_filename = sanitize_filename(att.FileName or f"attachment_{i}")
+                att.SaveAsFile(str(email_folder / att_filename))
+                attachment_links.append(f"- [{att_filename}]({att_filename})")
         except Exception:
             pass
 
-        md_content = f"""# {subject}
+        bundled = False
+        md_fd = None
+        if email_folder is not None:
+            md_path = email_folder / f"{filename_base}.md"
+        elif bundle_by:
+            key = bundle_key(bundle_by, date_filename, sender_name)
+            if key not in bundle_paths:
+                bundle_paths[key] = generate_unique_filename(output_dir, key, ".md", used_names)
+            md_path = bundle_paths[key]
+            bundled = True
+        else:
+            md_path, md_fd = open_unique_file(output_dir, filename_base, ".md", used_names)
+
+        return md_path, {
+            "bundled": bundled,
+            "md_fd": md_fd,
+            "subject": subject,
+            "sender": sender,
+            "to": to_recipients,
+            "cc": cc_recipients,
+            "date": date_display,
+            "html_body": html_body,
+            "plain_body": plain_body,
+            "attachment_links": attachment_links,
+        }
+
+    except Exception as e:
+        md_path, md_fd = open_unique_file(output_dir, "error_email", ".md", used_names)
+        return md_path, {"error": str(e), "md_fd": md_fd}
+
+
+def render_email(fields: dict) -> str:
+    """Build the Markdown document for an email read by read_email."""
+    if "error" in fields:
+        return f"# Error Processing Email\n\nError: {fields['error']}"
+
+    parts = [f"""# {fields['subject']}
 
 | Field | Value |
 |-------|-------|
-| **From** | {sender} |
-| **To** | {to_recipients} |
-| **CC** | {cc_recipients} |
-| **Date** | {date_display} |
+| **From** | {fields['sender']} |
+| **To** | {fields['to']} |
+| **CC** | {fields['cc']} |
+| **Date** | {fields['date']} |
 
-"""
+"""]
 
-        if attachment_links:
-            md_content += "## Attachments\n\n"
-            md_content += "\n".join(attachment_links)
-            md_content += "\n\n"
+    if fields["attachment_links"]:
+        parts.append("## Attachments\n\n")
+        parts.append("\n".join(fields["attachment_links"]))
+        parts.append("\n\n")
 
-        md_content += "## Content\n\n"
-        md_content += body_md
+    parts.append("## Content\n\n")
+    parts.append(html_to_markdown(fields["html_body"], fields["plain_body"]))
 
-        return filename_base, md_content, attachments
+    return "".join(parts)
 
-    except Exception as e:
-        return "error_email", f"# Error Processing Email\n\nError: {e}", []
 
+class ProgressRelay:
+    """
+    Stand-in for tqdm while converting a folder task. Total growth, updates
+    and messages are put on a queue for relay_progress, which owns the real
+    progress bars in the parent process. Updates are batched (see
+    _PROGRESS_BATCH) since each put may be a round-trip to the Manager.
+    """
 
-def count_emails_in_folder(folder) -> int:
-    """Recursively count all emails in a folder and its subfolders."""
-    count = 0
-    try:
-        count = folder.Items.Count
-    except Exception:
-        pass
+    def __init__(self, pst_index: int, progress):
+        self._pst_index = pst_index
+        self._progress = progress
+        self._total = 0
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @total.setter
+    def total(self, value: int) -> None:
+        self._progress.put(("total", self._pst_index, value - self._total))
+        self._total = value
+
+    def refresh(self) -> None:
+        """Send any batched updates now."""
+        with self._lock:
+            pending, self._pending = self._pending, 0
+            self._last_flush = time.monotonic()
+        if pending:
+            self._progress.put(("update", self._pst_index, pending))
+
+    def update(self, n: int = 1) -> None:
+        with self._lock:
+            self._pending += n
+            if self._pending < _PROGRESS_BATCH and time.monotonic() - self._last_flush < _PROGRESS_INTERVAL:
+                return
+        self.refresh()
+
+    def write(self, message: str) -> None:
+        self.refresh()
+        self._progress.put(("write", self._pst_index, message))
+
+
+def relay_progress(progress, pst_names: list[str]) -> None:
+    """Drive one tqdm bar per PST from ProgressRelay messages until a None sentinel."""
+    bars = [
+        tqdm(total=None, desc=pst_name, unit="email", position=idx, leave=True)
+        for idx, pst_name in enumerate(pst_names)
+    ]
+    while True:
+        message = progress.get()
+        if message is None:
+            break
+        kind, pst_index, value = message
+        bar = bars[pst_index]
+        if kind == "total":
+            bar.total = (bar.total or 0) + value
+            bar.refresh()
+        elif kind == "update":
+            bar.update(value)
+        else:
+            bar.write(value)
+
+    for bar in bars:
+        bar.close()
 
-    try:
-        for i in range(1, folder.Folders.Count + 1):
-            subfolder = folder.Folders.Item(i)
-            count += count_emails_in_folder(subfolder)
-    except Exception:
-        pass
 
-    return count
+def write_email(md_path: Path, fields: dict, pbar: ProgressRelay, bundle_files: dict[Path, TextIO]) -> bool:
+    """
+    Render and write one email; runs on a render thread.
+    Bundled emails are appended to the shared handle for md_path in
+    bundle_files, which holds at most _MAX_OPEN_BUNDLES handles in least
+    recently used order; the caller closes whatever is left open.
+    Other emails are written through the descriptor read_email opened
+    when it claimed md_path, if any; that file is removed again if the
+    email cannot be written, so no empty or partial .md is left behind.
+    Returns True if the Markdown was written.
+    """
+    md_fd = fields.get("md_fd")
+    claimed = md_fd is not None
+    try:
+        md_content = render_email(fields)
+        if fields.get("bundled"):
+            with _bundle_lock:
+                bundle = bundle_files.pop(md_path, None)
+                if bundle is None:
+                    if len(bundle_files) >= _MAX_OPEN_BUNDLES:
+                        bundle_files.pop(next(iter(bundle_files))).close()
+                    bundle = open(md_path, 'a', encoding='utf-8', buffering=_BUNDLE_BUFFER_SIZE)
+                bundle_files[md_path] = bundle
+                bundle.write(md_content + _BUNDLE_SEPARATOR)
+        else:
+            # write_markdown closes the descriptor, even on failure
+            fd, md_fd = md_fd, None
+            write_markdown(md_path, md_content, fd)
+        return True
+    except Exception as e:
+        pbar.write(f"Warning: Failed to write {md_path.name}: {e}")
+        if claimed:
+            release_claim(md_path, md_fd)
+            md_fd = None
+        return False
+    finally:
+        if md_fd is not None:
+            os.close(md_fd)
+        pbar.update(1)
+
+
+def render_worker(jobs: queue.Queue, pbar: ProgressRelay, results: list[bool],
+                  bundle_files: dict[Path, TextIO], converted: dict[str, tuple[str, str]]) -> None:
+    """
+    Consume (md_path, fields, cache_entry) jobs until a None sentinel is
+    received. cache_entry is (entry_id, modified) and is recorded in
+    converted once the email has been written.
+    """
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        md_path, fields, cache_entry = job
+        del job
+        written = write_email(md_path, fields, pbar, bundle_files)
+        # Release the bodies before blocking on the next job
+        del fields
+        if written and cache_entry is not None:
+            entry_id, modified = cache_entry
+            converted[entry_id] = (str(md_path), modified)
+        results.append(written)
+
+
+def discard_jobs(jobs: queue.Queue) -> None:
+    """Drop the jobs still queued, releasing the files their reads claimed."""
+    while True:
+        try:
+            md_path, fields, _ = jobs.get_nowait()
+        except queue.Empty:
+            return
+        if fields.get("md_fd") is not None:
+            release_claim(md_path, fields["md_fd"])
 
 
-def process_folder(folder, output_dir: Path, pbar: tqdm) -> int:
+def process_folder(folder, output_dir: Path, pbar: ProgressRelay, jobs: queue.Queue, used_names: set[str],
+                   bundle_by: Optional[str], bundle_paths: dict[str, Path],
+                   cache: dict[str, tuple[str, str]], shared_outputs: set[str], skipped: list[str],
+                   read_count: int = 0, recursive: bool = True) -> int:
     """
-    Recursively process all emails in a folder and its subfolders.
-    Returns count of processed emails.
+    Read all emails in a folder (and, if recursive, its subfolders), putting
+    each one on jobs for the render threads to convert and write.
+    Emails whose cache entry matches their modification time and whose
+    output still exists are skipped without opening the mail item, and
+    their EntryIDs are appended to skipped. Emails that changed since have
+    their old output removed first, unless it is a bundle file listed in
+    shared_outputs that other emails were written to as well.
+    read_count is the number of emails read so far in this task, carried
+    across folders so memory is released every _RELEASE_INTERVAL emails;
+    returns the updated count.
     """
-    processed = 0
 
     try:
-        items = folder.Items
-        for i in range(1, items.Count + 1):
+        session = folder.Session
+        store_id = folder.StoreID
+        table = folder.GetTable(_MAIL_FILTER)
+        columns = table.Columns
+        columns.RemoveAll()
+        for column in _HEADER_COLUMNS:
+            columns.Add(column)
+
+        # The total grows as folders are reached, instead of a separate counting pass
+        pbar.total = (pbar.total or 0) + table.GetRowCount()
+        pbar.refresh()
+
+        while not table.EndOfTable:
+            # A failed GetNextRow may not advance the cursor, so it ends the folder
+            try:
+                row = table.GetNextRow()
+            except Exception as e:
+                pbar.write(f"Warning: Error reading folder table: {e}")
+                break
+            if row is None:
+                break
+
             try:
-                item = items.Item(i)
-                if item.Class == 43:  # olMail
-                    filename_base, md_content, attachments = create_email_markdown(item)
-
-                    if attachments:
-                        email_folder = generate_unique_filename(output_dir, filename_base)
-                        email_folder.mkdir(parents=True, exist_ok=True)
-
-                        md_path = email_folder / f"{filename_base}.md"
-                        md_path.write_text(md_content, encoding='utf-8')
-
-                        for att_name, att_data in attachments:
-                            att_path = email_folder / att_name
-                            att_path.write_bytes(att_data)
-                    else:
-                        md_path = generate_unique_filename(output_dir, filename_base, ".md")
-                        md_path.write_text(md_content, encoding='utf-8')
-
-                    processed += 1
-                    pbar.update(1)
+                header = dict(zip(_HEADER_COLUMNS, row.GetValues()))
+                entry_id = header["EntryID"]
+                modified = str(header["LastModificationTime"])
+
+                cached = cache.get(entry_id)
+                if cached is not None:
+                    if cached[1] == modified and Path(cached[0]).exists():
+                        skipped.append(entry_id)
+                        pbar.update(1)
+                        continue
+                    if cached[0] not in shared_outputs:
+                        remove_stale_output(Path(cached[0]), output_dir, used_names)
+
+                item = session.GetItemFromID(entry_id, store_id)
+                md_path, fields = read_email(item, header, output_dir, used_names, bundle_by, bundle_paths)
+                cache_entry = None if "error" in fields else (entry_id, modified)
+                jobs.put((md_path, fields, cache_entry))
+
+                # Drop the COM item and the body strings now; the queued job
+                # holds the only remaining reference to the bodies
+                del item, fields, header, row
+                read_count += 1
+                if read_count % _RELEASE_INTERVAL == 0:
+                    gc.collect()
+                    pythoncom.PumpWaitingMessages()
             except Exception as e:
                 pbar.write(f"Warning: Failed to process item: {e}")
                 pbar.update(1)
     except Exception as e:
         pbar.write(f"Warning: Error accessing folder items: {e}")
 
+    if not recursive:
+        return read_count
+
     try:
-        for i in range(1, folder.Folders.Count + 1):
-            subfolder = folder.Folders.Item(i)
-            processed += process_folder(subfolder, output_dir, pbar)
+        subfolders = folder.Folders
+        subfolder = subfolders.GetFirst()
+        while subfolder is not None:
+            read_count = process_folder(subfolder, output_dir, pbar, jobs, used_names, bundle_by, bundle_paths,
+                                        cache, shared_outputs, skipped, read_count)
+            subfolder = subfolders.GetNext()
     except Exception:
         pass
 
-    return processed
+    return read_count
 
 
-def process_pst_file(pst_path: Path, output_dir: Optional[Path], worker_id: int) -> tuple[str, int, Optional[str]]:
+def locate_pst_folder(namespace, pst_path: Path):
+    """Return the root folder of the store opened from pst_path, or None."""
+    for i in range(1, namespace.Folders.Count + 1):
+        folder = namespace.Folders.Item(i)
+        try:
+            store_path = folder.Store.FilePath
+            if Path(store_path).resolve() == pst_path.resolve():
+                return folder
+        except Exception:
+            continue
+
+    # Fall back to the most recently added store
+    count = namespace.Folders.Count
+    return namespace.Folders.Item(count) if count else None
+
+
+def list_folder_tasks(pst_folder) -> list[tuple[str, bool]]:
     """
-    Process a single PST file.
-    Returns (pst_name, processed_count, error_message).
+    Split a PST into (folder EntryID, recursive) tasks: the root's own
+    items, then one task per top-level folder and everything below it.
     """
-    pst_name = pst_path.name
+    tasks = []
+    if pst_folder.Items.Count:
+        tasks.append((pst_folder.EntryID, False))
+
+    subfolders = pst_folder.Folders
+    subfolder = subfolders.GetFirst()
+    while subfolder is not None:
+        tasks.append((subfolder.EntryID, True))
+        subfolder = subfolders.GetNext()
 
-    if not pst_path.exists():
-        return pst_name, 0, f"File not found: {pst_path}"
+    return tasks
 
-    if output_dir is None:
-        output_dir = pst_path.parent
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+def process_folder_task(pst_index: int, pst_name: str, output_dir: Path, store_id: str, folder_id: str,
+                        recursive: bool, bundle_by: Optional[str],
+                        progress) -> tuple[int, int, int, dict[str, tuple[str, str]], Optional[str]]:
+    """
+    Convert one folder of a PST that the parent has already attached to Outlook.
+    Returns (pst_index, processed_count, skipped_count, converted_entries, error_message).
+    """
+    pbar = ProgressRelay(pst_index, progress)
 
+    # Each worker process needs its own COM apartment
+    pythoncom.CoInitialize()
     try:
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        namespace = outlook.GetNamespace("MAPI")
+        # Early binding: generated wrappers cache DISPIDs for every property access
+        outlook = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+        folder = outlook.GetNamespace("MAPI").GetFolderFromID(folder_id, store_id)
+
+        used_names = {entry.name for entry in output_dir.iterdir()}
+        cache = load_conversion_cache(output_dir / _CACHE_FILENAME.format(pst_name))
+        # Bundle files hold several emails, so one changed email must not remove them
+        output_counts = Counter(md_path for md_path, _ in cache.values())
+        shared_outputs = {md_path for md_path, count in output_counts.items() if count > 1}
+        converted: dict[str, tuple[str, str]] = {}
+        skipped: list[str] = []
+
+        jobs: queue.Queue = queue.Queue(maxsize=_RENDER_QUEUE_SIZE)
+        results: list[bool] = []
+        bundle_files: dict[Path, TextIO] = {}
+        renderers = [
+            threading.Thread(target=render_worker, args=(jobs, pbar, results, bundle_files, converted),
+                             daemon=True)
+            for _ in range(_RENDER_THREADS)
+        ]
+        for renderer in renderers:
+            renderer.start()
 
-        namespace.AddStore(str(pst_path))
+        try:
+            bundle_paths = _bundle_paths.setdefault(output_dir, {})
+            process_folder(folder, output_dir, pbar, jobs, used_names, bundle_by, bundle_paths, cache,
+                           shared_outputs, skipped, recursive=recursive)
+        except BaseException:
+            # Interrupted: stop instead of writing the backlog, without
+            # leaving its claimed files empty
+            discard_jobs(jobs)
+            raise
+        finally:
+            for _ in renderers:
+                jobs.put(None)
+            for renderer in renderers:
+                renderer.join()
+            for bundle in bundle_files.values():
+                bundle.close()
+
+        return pst_index, sum(results), len(skipped), converted, None
 
-        pst_folder = None
-        for i in range(1, namespace.Folders.Count + 1):
-            folder = namespace.Folders.Item(i)
-            try:
-                store_path = folder.Store.FilePath
-                if Path(store_path).resolve() == pst_path.resolve():
-                    pst_folder = folder
-                    break
-            except Exception:
-                continue
+    except Exception as e:
+        return pst_index, 0, 0, {}, str(e)
+    finally:
+        pbar.refresh()
+        pythoncom.CoUninitialize()
 
-        if pst_folder is None:
-            for i in range(namespace.Folders.Count, 0, -1):
-                folder = namespace.Folders.Item(i)
-                pst_folder = folder
-                break
 
-        if pst_folder is None:
-            return pst_name, 0, "Could not locate PST folder in Outlook"
+def run_folder_tasks(tasks: list[tuple], num_workers: int,
+                     progress) -> Iterator[tuple[int, int, int, dict[str, tuple[str, str]], Optional[str]]]:
+    """
+    Run folder tasks inline for a single worker, otherwise on a process pool.
+    Yields each task's result as soon as it finishes.
+    """
+    if num_workers == 1:
+        for task in tasks:
+            yield process_folder_task(*task, progress)
+        return
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(process_folder_task, *task, progress) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
 
-        total_emails = count_emails_in_folder(pst_folder)
 
-        with tqdm(total=total_emails, desc=f"[Worker {worker_id}] {pst_name}",
-                  unit="email", position=worker_id, leave=True) as pbar:
-            processed = process_folder(pst_folder, output_dir, pbar)
+def convert_pst_files(pst_files: list[Path], output_dir: Optional[Path], num_workers: int,
+                      bundle_by: Optional[str] = None) -> list[tuple[str, int, int, Optional[str]]]:
+    """
+    Attach every PST to Outlook, split each into top-level folder tasks and
+    convert them on up to num_workers processes (no more than there are
+    tasks), so one large PST does not leave the other workers idle.
+    Returns (pst_name, processed_count, skipped_count, error_message) per PST,
+    where skipped_count is the emails left unchanged since the last run.
+    """
+    processed = [0] * len(pst_files)
+    skipped = [0] * len(pst_files)
+    errors: list[list[str]] = [[] for _ in pst_files]
+    converted: list[dict[str, tuple[str, str]]] = [{} for _ in pst_files]
+    output_dirs = [output_dir or pst_path.parent for pst_path in pst_files]
+    attached = {}
+    tasks = []
+    _bundle_paths.clear()
+
+    pythoncom.CoInitialize()
+    try:
+        outlook = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+        namespace = outlook.GetNamespace("MAPI")
 
-        try:
-            namespace.RemoveStore(pst_folder)
-        except Exception:
-            pass
+        for idx, pst_path in enumerate(pst_files):
+            try:
+                output_dirs[idx].mkdir(parents=True, exist_ok=True)
+                namespace.AddStore(str(pst_path))
+
+                pst_folder = locate_pst_folder(namespace, pst_path)
+                if pst_folder is None:
+                    errors[idx].append("Could not locate PST folder in Outlook")
+                    continue
+                attached[idx] = pst_folder
+
+                store_id = pst_folder.StoreID
+                for folder_id, recursive in list_folder_tasks(pst_folder):
+                    tasks.append((idx, pst_path.name, output_dirs[idx], store_id, folder_id, recursive, bundle_by))
+            except Exception as e:
+                errors[idx].append(str(e))
 
-        return pst_name, processed, None
+        # More processes than folder tasks would only sit idle
+        num_workers = max(1, min(num_workers, len(tasks)))
+        print(f"Processing {len(pst_files)} PST file(s) with {num_workers} worker(s)")
+        print()
+
+        with (multiprocessing.Manager() if num_workers > 1 else nullcontext()) as manager:
+            progress = manager.Queue() if manager is not None else queue.Queue()
+            relay = threading.Thread(target=relay_progress, args=(progress, [p.name for p in pst_files]))
+            relay.start()
+            try:
+                for idx, count, unchanged, entries, error in run_folder_tasks(tasks, num_workers, progress):
+                    processed[idx] += count
+                    skipped[idx] += unchanged
+                    converted[idx].update(entries)
+                    if error:
+                        errors[idx].append(error)
+            finally:
+                progress.put(None)
+                relay.join()
 
     except Exception as e:
-        return pst_name, 0, str(e)
+        for idx in range(len(pst_files)):
+            errors[idx].append(str(e))
+    finally:
+        # Runs on failure and Ctrl+C too: keep the work that finished and never
+        # leave the PSTs attached to the user's Outlook profile
+        for idx in attached:
+            cache_path = output_dirs[idx] / _CACHE_FILENAME.format(pst_files[idx].name)
+            try:
+                cache = load_conversion_cache(cache_path)
+                cache.update(converted[idx])
+                save_conversion_cache(cache_path, cache)
+            except Exception as e:
+                print(f"Warning: Could not save conversion cache: {e}")
+
+        for pst_folder in attached.values():
+            try:
+                namespace.RemoveStore(pst_folder)
+            except Exception:
+                pass
+
+        pythoncom.CoUninitialize()
+
+    return [
+        (pst_path.name, processed[idx], skipped[idx], "; ".join(errors[idx]) or None)
+        for idx, pst_path in enumerate(pst_files)
+    ]
 
 
 def main():
@@ -348,6 +880,7 @@ def main():
 Examples:
   %(prog)s -i emails.pst
   %(prog)s -i file1.pst file2.pst -o ./output -w 2
+  %(prog)s -i emails.pst --bundle-by day
         """
     )
 
@@ -375,6 +908,12 @@ Examples:
         help='Number of parallel workers (default: 1)'
     )
 
+    parser.add_argument(
+        '--bundle-by',
+        choices=_BUNDLE_CHOICES,
+        help='Append emails without attachments to one Markdown file per day, month or sender'
+    )
+
     args = parser.parse_args()
 
     pst_files = [p.resolve() for p in args.input]
@@ -387,26 +926,7 @@ Examples:
 
     output_dir = args.output.resolve() if args.output else None
 
-    num_workers = min(args.workers, len(pst_files))
-
-    print(f"Processing {len(pst_files)} PST file(s) with {num_workers} worker(s)")
-    print()
-
-    results = []
-
-    if num_workers == 1:
-        for pst_path in pst_files:
-            result = process_pst_file(pst_path, output_dir, 0)
-            results.append(result)
-    else:
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            futures = {
-                executor.submit(process_pst_file, pst_path, output_dir, idx): pst_path
-                for idx, pst_path in enumerate(pst_files)
-            }
-
-            for future in as_completed(futures):
-                results.append(future.result())
+    results = convert_pst_files(pst_files, output_dir, max(1, args.workers), args.bundle_by)
 
     print()
     print("=" * 50)
@@ -414,14 +934,21 @@ Examples:
     print("=" * 50)
 
     total_processed = 0
-    for pst_name, count, error in results:
-        if error:
+    total_skipped = 0
+    for pst_name, count, skipped, error in results:
+        unchanged = f", {skipped} unchanged skipped" if skipped else ""
+        if error and not count and not skipped:
             print(f"  {pst_name}: FAILED - {error}")
+        elif error:
+            print(f"  {pst_name}: {count} emails processed{unchanged}, with errors - {error}")
         else:
-            print(f"  {pst_name}: {count} emails processed")
-            total_processed += count
+            print(f"  {pst_name}: {count} emails processed{unchanged}")
+        total_processed += count
+        total_skipped += skipped
 
     print(f"\nTotal: {total_processed} emails converted to Markdown")
+    if total_skipped:
+        print(f"Skipped: {total_skipped} unchanged emails from earlier runs")
 
 
 if __name__ == "__main__":